@@ -27,6 +27,8 @@ class RegularCustomerInline(admin.TabularInline):
 
     model = RegularCustomer
 
+    raw_id_fields = ("address",)
+
 
 class BusinessCustomerInline(admin.TabularInline):
 
@@ -41,15 +43,69 @@ class CustomerAdmin(admin.ModelAdmin):
                RegularContractTabularInline,
                BusinessContractTabularInline]
 
+    list_per_page = 50
+
     class Meta:
         model = Customer
 
 
+class AccountAdmin(admin.ModelAdmin):
+
+    list_select_related = True
+
+    list_per_page = 50
+
+    search_fields = ("number",)
+
+    raw_id_fields = ("customer",)
+
+
+class AddressAdmin(admin.ModelAdmin):
+
+    list_per_page = 50
+
+    search_fields = ("street", "city", "postal_code")
+
+
+class RegularContractAdmin(admin.ModelAdmin):
+
+    list_select_related = True
+
+    list_per_page = 50
+
+    raw_id_fields = ("customer",)
+
+
+class BusinessContractAdmin(admin.ModelAdmin):
+
+    list_select_related = True
+
+    list_per_page = 50
+
+    raw_id_fields = ("customer",)
+
+
+class ServiceAdmin(admin.ModelAdmin):
+
+    list_per_page = 50
+
+    search_fields = ("name",)
+
+
+class AddendumAdmin(admin.ModelAdmin):
+
+    list_select_related = True
+
+    list_per_page = 50
+
+    raw_id_fields = ("regular_contract", "business_contract")
+
+
 admin.site.register(Customer, CustomerAdmin)
 
-admin.site.register(Account)
-admin.site.register(Address)
-admin.site.register(RegularContract)
-admin.site.register(BusinessContract)
-admin.site.register(Service)
-admin.site.register(Addendum)
\ No newline at end of file
+admin.site.register(Account, AccountAdmin)
+admin.site.register(Address, AddressAdmin)
+admin.site.register(RegularContract, RegularContractAdmin)
+admin.site.register(BusinessContract, BusinessContractAdmin)
+admin.site.register(Service, ServiceAdmin)
+admin.site.register(Addendum, AddendumAdmin)
@@ -2,67 +2,104 @@ import random
 import re
 from datetime import timedelta
 
+from django.db import transaction
 from django.utils import timezone
 from djmoney.money import Money
 from faker import Faker
+from moneyed import Currency
 
 from webcom import models
-from webcom.models import Customer, TechnicalEmployee
+from webcom.models import Customer, TechnicalEmployee, _bulk_create
+
+# Cached currency object, saving djmoney a registry lookup per Money built.
+_USD = Currency(code="USD")
+
+# Money instances for the fixed salary set, built once instead of per row.
+_SALARY_POOL = [Money(value, _USD) for value in (1000, 2500, 4500, 5000)]
+
+# Pool of all possible apartment number strings, built once so per-row draws
+# index into it instead of converting a fresh int per row.
+_APT_POOL = [str(i) for i in range(100, 1000)]
+
+# Precompiled pattern stripping formatting characters from phone numbers.
+_PHONE_STRIP = re.compile(r"[\s()\-]")
+
+# Shared Faker instance. Locale/provider loading is the expensive part of
+# Faker construction, so all Factory instances reuse this one object.
+_FAKE = Faker("en_US")
 
 
 class Factory:
+    """
+    Generator of model instances with fake data. All instances share a single
+    module-level Faker, so generator methods are not thread-safe; callers
+    needing threads should hold a lock or create a scoped Faker instance.
+    """
 
     def __init__(self):
-        self.fake = Faker("en_US")
+        self.fake = _FAKE
+
+    @classmethod
+    def seed(cls, n):
+        """
+        Seed the shared Faker instance for deterministic generation.
+        :param n: int seed value
+        :return: None
+        """
+        _FAKE.seed_instance(n)
+
+    def _save(self, instance):
+        """
+        Save path for single-row callers of the generate_* methods.
+        :param instance: unsaved model instance
+        :return: saved instance
+        """
+        instance.save()
+        return instance
 
     def generate_address(self):
         street = self.fake.street_address()
         postal_code = self.fake.postcode()
         city = self.fake.city()
-        return models.Address.objects.create(street=street, city=city, postal_code=postal_code)
+        return models.Address(street=street, city=city, postal_code=postal_code)
 
-    def generate_account(self):
-        number = self.fake.credit_card_number()
-        balance = Money(random.randint(0, 1000))
-        return models.Account(number=number, balance=balance)
+    def generate_account(self, balance=None):
+        # A random 16-digit identifier is enough for an account number and
+        # skips Faker's credit-card provider (BIN tables + Luhn checksum).
+        number = str(random.randrange(10 ** 15, 10 ** 16))
+        if balance is None:
+            balance = random.randint(0, 1000)
+        return models.Account(number=number, balance=Money(balance))
 
-    def generate_regular_contract(self, expirable=True):
-        approval_date = timezone.localtime(timezone.now())
+    def generate_regular_contract(self, expirable=True, now=None):
+        approval_date = now if now else timezone.localtime(timezone.now())
         termination_date = approval_date + timedelta(days=random.randint(100, 720))
         termination_delay = random.choice((14, 30))
+        kwargs = {"approval_date": approval_date, "termination_delay": termination_delay}
         if expirable:
-            contract = models.RegularContract(approval_date=approval_date,
-                                       termination_date=termination_date,
-                                       termination_delay=termination_delay)
-        else:
-            contract = models.RegularContract(approval_date=approval_date,
-                                       termination_delay=termination_delay)
-        return contract
-
-    def generate_business_contract(self, expirable=True):
-        approval_date = timezone.localtime(timezone.now())
+            kwargs["termination_date"] = termination_date
+        return models.RegularContract(**kwargs)
+
+    def generate_business_contract(self, expirable=True, now=None):
+        approval_date = now if now else timezone.localtime(timezone.now())
         termination_date = approval_date + timedelta(days=random.randint(100, 720))
         termination_delay = random.choice((30, 100))
+        kwargs = {"approval_date": approval_date, "termination_delay": termination_delay}
         if expirable:
-            contract = models.BusinessContract(approval_date=approval_date,
-                                       termination_date=termination_date,
-                                       termination_delay=termination_delay)
-        else:
-            contract = models.BusinessContract(approval_date=approval_date,
-                                       termination_delay=termination_delay)
-        return contract
+            kwargs["termination_date"] = termination_date
+        return models.BusinessContract(**kwargs)
 
     def generate_individual_customer(self, address=None):
         # Person stuff
         first_name = self.fake.first_name()
         last_name = self.fake.last_name()
-        apartment_number = str(random.randint(100, 999))
-        n_address = address if address else self.generate_address()
+        apartment_number = random.choice(_APT_POOL)
+        n_address = address if address else self._save(self.generate_address())
         # Customer stuff
         account = self.generate_account()
         contract = self.generate_regular_contract(expirable=random.choice((True,False)))
         email = self.fake.email()
-        phone_number = re.sub(r"(\s|-|\(|\))", "", self.fake.phone_number())
+        phone_number = _PHONE_STRIP.sub("", self.fake.phone_number())
         return Customer.create(customer_type=Customer.REGULAR,
                                contract=contract,
                                account=account,
@@ -73,6 +110,51 @@ class Factory:
                                email=email,
                                phone_number=phone_number)
 
+    def generate_individual_customers(self, n, address=None):
+        """
+        Batch method generating n regular customers in a single transaction.
+        Model instances are built in lists and persisted per model with
+        bulk_create instead of one-by-one INSERTs.
+        :param n: int number of customers to generate
+        :param address: optional Address object shared by all customers
+        :return: list of Customer objects
+        """
+        with transaction.atomic():
+            now = timezone.localtime(timezone.now())
+            if address:
+                addresses = [address] * n
+            else:
+                addresses = _bulk_create(models.Address.objects,
+                                         [self.generate_address() for _ in range(n)])
+            # Provider methods are bound once and drawn in tight per-provider
+            # loops, amortizing Faker's attribute dispatch across the batch.
+            email = self.fake.email
+            emails = [email() for _ in range(n)]
+            phone_number = self.fake.phone_number
+            phone_numbers = [_PHONE_STRIP.sub("", phone_number()) for _ in range(n)]
+            first_name = self.fake.first_name
+            first_names = [first_name() for _ in range(n)]
+            last_name = self.fake.last_name
+            last_names = [last_name() for _ in range(n)]
+            # Random draws are materialized up-front in single C-level calls
+            # instead of one Python-level call per row.
+            balances = random.choices(range(0, 1001), k=n)
+            expirables = random.choices((True, False), k=n)
+            apartment_numbers = random.choices(_APT_POOL, k=n)
+            parts = [Customer.build_regular(contract=self.generate_regular_contract(expirable=expirable, now=now),
+                                            account=self.generate_account(balance=balance),
+                                            email=n_email,
+                                            phone_number=n_phone_number,
+                                            first_name=n_first_name,
+                                            last_name=n_last_name,
+                                            apartment_number=apartment_number,
+                                            address=n_address)
+                     for n_address, balance, expirable, apartment_number, n_email,
+                         n_phone_number, n_first_name, n_last_name in
+                     zip(addresses, balances, expirables, apartment_numbers,
+                         emails, phone_numbers, first_names, last_names)]
+            return Customer.bulk_create_customers(parts)
+
     def generate_business_customer(self):
         # Business customer stuff
         company_name = self.fake.company()
@@ -81,7 +163,7 @@ class Factory:
         account = self.generate_account()
         contract = self.generate_business_contract(expirable=random.choice((True,False)))
         email = self.fake.email()
-        phone_number = re.sub(r"(\s|-|\(|\))", "", self.fake.phone_number())
+        phone_number = _PHONE_STRIP.sub("", self.fake.phone_number())
         return Customer.create(customer_type=Customer.BUSINESS,
                                contract=contract,
                                account=account,
@@ -90,18 +172,51 @@ class Factory:
                                email=email,
                                phone_number=phone_number)
 
+    def generate_business_customers(self, n):
+        """
+        Batch method generating n business customers in a single transaction,
+        persisting each model list with bulk_create.
+        :param n: int number of customers to generate
+        :return: list of Customer objects
+        """
+        with transaction.atomic():
+            now = timezone.localtime(timezone.now())
+            # Provider methods are bound once and drawn in tight per-provider
+            # loops, amortizing Faker's attribute dispatch across the batch.
+            email = self.fake.email
+            emails = [email() for _ in range(n)]
+            phone_number = self.fake.phone_number
+            phone_numbers = [_PHONE_STRIP.sub("", phone_number()) for _ in range(n)]
+            company = self.fake.company
+            company_names = [company() for _ in range(n)]
+            ean = self.fake.ean
+            company_ids = [ean(length=13) for _ in range(n)]
+            # Random draws are materialized up-front in single C-level calls
+            # instead of one Python-level call per row.
+            balances = random.choices(range(0, 1001), k=n)
+            expirables = random.choices((True, False), k=n)
+            parts = [Customer.build_business(contract=self.generate_business_contract(expirable=expirable, now=now),
+                                             account=self.generate_account(balance=balance),
+                                             email=n_email,
+                                             phone_number=n_phone_number,
+                                             company_name=company_name,
+                                             company_id=company_id)
+                     for balance, expirable, n_email, n_phone_number, company_name, company_id in
+                     zip(balances, expirables, emails, phone_numbers, company_names, company_ids)]
+            return Customer.bulk_create_customers(parts)
+
     def generate_technical_employee(self, address=None, employee_type=None):
         # Person stuff
         first_name = self.fake.first_name()
         last_name = self.fake.last_name()
-        apartment_number = str(random.randint(100, 999))
-        n_address = address if address else self.generate_address()
+        apartment_number = random.choice(_APT_POOL)
+        n_address = address if address else self._save(self.generate_address())
         # Employee stuff
-        salary = Money(random.choice((1000, 2500, 4500, 5000)), "USD")
+        salary = random.choice(_SALARY_POOL)
         seniority = random.randint(1, 10)
         email = self.fake.email()
-        phone_number = re.sub(r"(\s|-|\(|\))", "", self.fake.phone_number())
-        employee_type = employee_type if employee_type else random.choice((TechnicalEmployee.TECHNICIAN, TechnicalEmployee.SYSADMIN))
+        phone_number = _PHONE_STRIP.sub("", self.fake.phone_number())
+        employee_type = employee_type if employee_type is not None else random.choice((TechnicalEmployee.TECHNICIAN, TechnicalEmployee.SYSADMIN))
         return TechnicalEmployee.create(type=employee_type,
                                         email=email,
                                         phone_number=phone_number,
@@ -111,3 +226,55 @@ class Factory:
                                         address=n_address,
                                         salary=salary,
                                         seniority=seniority)
+
+    def generate_technical_employees(self, n):
+        """
+        Batch method generating n technical employees in a single transaction.
+        The type split is drawn once up-front and the employees are built in
+        two homogeneous batches (technicians first, then sysadmins) so each
+        extension table gets a single bulk_create.
+        :param n: int number of employees to generate
+        :return: list of TechnicalEmployee objects
+        """
+        with transaction.atomic():
+            n_tech = sum(random.choices((0, 1), k=n))
+            addresses = _bulk_create(models.Address.objects,
+                                     [self.generate_address() for _ in range(n)])
+            # Provider methods are bound once and drawn in tight per-provider
+            # loops, amortizing Faker's attribute dispatch across the batch.
+            email = self.fake.email
+            emails = [email() for _ in range(n)]
+            phone_number = self.fake.phone_number
+            phone_numbers = [_PHONE_STRIP.sub("", phone_number()) for _ in range(n)]
+            first_name = self.fake.first_name
+            first_names = [first_name() for _ in range(n)]
+            last_name = self.fake.last_name
+            last_names = [last_name() for _ in range(n)]
+            # Random draws are materialized up-front in single C-level calls
+            # instead of one Python-level call per row.
+            salaries = random.choices(_SALARY_POOL, k=n)
+            seniorities = random.choices(range(1, 11), k=n)
+            apartment_numbers = random.choices(_APT_POOL, k=n)
+            employee_types = [TechnicalEmployee.TECHNICIAN] * n_tech + \
+                             [TechnicalEmployee.SYSADMIN] * (n - n_tech)
+            employees = [TechnicalEmployee(employee_type=n_employee_type,
+                                           email=n_email,
+                                           phone_number=n_phone_number,
+                                           first_name=n_first_name,
+                                           last_name=n_last_name,
+                                           apartment_number=apartment_number,
+                                           address=n_address,
+                                           salary=salary,
+                                           seniority=seniority)
+                         for n_employee_type, n_address, salary, seniority, apartment_number,
+                             n_email, n_phone_number, n_first_name, n_last_name in
+                         zip(employee_types, addresses, salaries, seniorities, apartment_numbers,
+                             emails, phone_numbers, first_names, last_names)]
+            _bulk_create(TechnicalEmployee.objects, employees)
+            models.Technician.objects.bulk_create(
+                [models.Technician(technicalemployee_base=employee) for employee in employees[:n_tech]],
+                batch_size=1000)
+            models.SysAdmin.objects.bulk_create(
+                [models.SysAdmin(technicalemployee_base=employee) for employee in employees[n_tech:]],
+                batch_size=1000)
+            return employees
@@ -0,0 +1,32 @@
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webcom', '0003_auto_20180605_1418'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='addendum',
+            index=models.Index(fields=['regular_contract', '-datetime_created'], name='webcom_adde_regular_4c386c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='addendum',
+            index=models.Index(fields=['business_contract', '-datetime_created'], name='webcom_adde_busines_7122d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='businesscontract',
+            index=models.Index(fields=['status'], name='webcom_busi_status_85d836_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['type'], name='webcom_cust_type_b73b82_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='regularcontract',
+            index=models.Index(fields=['status'], name='webcom_regu_status_bc20c0_idx'),
+        ),
+    ]
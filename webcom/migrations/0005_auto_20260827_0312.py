@@ -0,0 +1,85 @@
+from django.db import migrations, models
+
+# Mapping of the old string enum values to their new integer codes
+CUSTOMER_TYPES = {"REGULAR": 0, "BUSINESS": 1}
+STATUSES = {"ACTIVE": 0, "SUSPENDED": 1}
+DURATION_TYPES = {"EXPIRABLE": 0, "NONEXPIRABLE": 1}
+EMPLOYEE_TYPES = {"Technician": 0, "SysAdmin": 1}
+
+
+def convert_enums_to_integers(apps, schema_editor):
+    """
+    Map the old string enum values to their integer codes while the columns
+    are still text; the following AlterField operations cast them.
+    """
+    Customer = apps.get_model("webcom", "Customer")
+    TechnicalEmployee = apps.get_model("webcom", "TechnicalEmployee")
+    for value, code in CUSTOMER_TYPES.items():
+        Customer.objects.filter(type=value).update(type=code)
+    for value, code in EMPLOYEE_TYPES.items():
+        TechnicalEmployee.objects.filter(employee_type=value).update(employee_type=code)
+    for contract_model in ("RegularContract", "BusinessContract"):
+        Contract = apps.get_model("webcom", contract_model)
+        for value, code in STATUSES.items():
+            Contract.objects.filter(status=value).update(status=code)
+        for value, code in DURATION_TYPES.items():
+            Contract.objects.filter(duration_type=value).update(duration_type=code)
+
+
+def convert_enums_to_strings(apps, schema_editor):
+    """
+    Reverse mapping of the integer codes back to the old string values.
+    """
+    Customer = apps.get_model("webcom", "Customer")
+    TechnicalEmployee = apps.get_model("webcom", "TechnicalEmployee")
+    for value, code in CUSTOMER_TYPES.items():
+        Customer.objects.filter(type=code).update(type=value)
+    for value, code in EMPLOYEE_TYPES.items():
+        TechnicalEmployee.objects.filter(employee_type=code).update(employee_type=value)
+    for contract_model in ("RegularContract", "BusinessContract"):
+        Contract = apps.get_model("webcom", contract_model)
+        for value, code in STATUSES.items():
+            Contract.objects.filter(status=code).update(status=value)
+        for value, code in DURATION_TYPES.items():
+            Contract.objects.filter(duration_type=code).update(duration_type=value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webcom', '0004_auto_20260827_0311'),
+    ]
+
+    operations = [
+        migrations.RunPython(convert_enums_to_integers, convert_enums_to_strings),
+        migrations.AlterField(
+            model_name='businesscontract',
+            name='duration_type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'EXPIRABLE'), (1, 'NONEXPIRABLE')], default=0),
+        ),
+        migrations.AlterField(
+            model_name='businesscontract',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'ACTIVE'), (1, 'SUSPENDED')], default=0),
+        ),
+        migrations.AlterField(
+            model_name='customer',
+            name='type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Regular'), (1, 'Business')]),
+        ),
+        migrations.AlterField(
+            model_name='regularcontract',
+            name='duration_type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'EXPIRABLE'), (1, 'NONEXPIRABLE')], default=0),
+        ),
+        migrations.AlterField(
+            model_name='regularcontract',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'ACTIVE'), (1, 'SUSPENDED')], default=0),
+        ),
+        migrations.AlterField(
+            model_name='technicalemployee',
+            name='employee_type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Technician'), (1, 'System administrator')]),
+        ),
+    ]
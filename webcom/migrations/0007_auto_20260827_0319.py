@@ -0,0 +1,16 @@
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webcom', '0006_auto_20260827_0315'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='addendum',
+            options={'get_latest_by': 'datetime_created'},
+        ),
+    ]
@@ -1,16 +1,69 @@
+import re
+from collections import namedtuple
 from datetime import timedelta
-from functools import reduce
+from decimal import Decimal
 
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator, MinValueValidator
-from django.db import models
-from django.db.models import Count
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from djmoney.models.fields import MoneyField
 from djmoney.money import Money
 
 
+# Precompiled phone number pattern shared by the field validator and the
+# batch validation helper
+_PHONE_RE = re.compile(r'^\+?\d{9,20}$')
+
+# Zero bonus amount built once; Money construction parses a Decimal and
+# resolves the currency on every call otherwise
+_ZERO = Money("0.0")
+
+# Sysadmin bonus rate as a Decimal, skipping the per-call float coercion
+_BONUS_RATE = Decimal("0.1")
+
+# Default duration of non-terminated contracts, built once instead of per
+# duration access
+_DEFAULT_DURATION = timedelta(days=100)
+
+
+def validate_phones(phone_numbers):
+    """
+    Batch validation helper matching phone numbers against the precompiled
+    pattern in one C-level pass, without per-object validator dispatch.
+    :param phone_numbers: iterable of str
+    :return: list of valid phone numbers
+    """
+    return list(filter(_PHONE_RE.match, phone_numbers))
+
+
+def _bulk_create(manager, instances, batch_size=1000):
+    """
+    Persist instances with bulk_create and backfill primary keys on backends
+    that do not return them from the insert (e.g. SQLite).
+    :param manager: model manager used for insertion
+    :param instances: list of unsaved model instances
+    :param batch_size: int
+    :return: list of saved instances
+    """
+    manager.bulk_create(instances, batch_size=batch_size)
+    if instances and instances[-1].pk is None:
+        pks = manager.order_by("-pk").values_list("pk", flat=True)[:len(instances)]
+        for instance, pk in zip(instances, reversed(list(pks))):
+            instance.pk = pk
+            # bulk_create only marks objects that already had a pk as saved;
+            # mirror that here so relation managers accept the instances
+            instance._state.adding = False
+            instance._state.db = manager.db
+    return instances
+
+
 class Address(models.Model):
     """
     Model representing address data in the system.
@@ -59,7 +112,7 @@ class ContactDataMixin(models.Model):
     # Required email field :type str
     email = models.EmailField(max_length=30, blank=False)
     # Validator for phone_number field
-    phone_regex = RegexValidator(regex=r'^\+?\d{9,20}$',
+    phone_regex = RegexValidator(regex=_PHONE_RE.pattern,
                                  message=_("Phone number must be entered in the format: '+999999999'. Up to 20 digits allowed."))
     # Required field phone_number with phone_regex validator:type str
     phone_number = models.CharField(validators=[phone_regex], max_length=20, blank=False)
@@ -69,39 +122,89 @@ class ContactDataMixin(models.Model):
         abstract=True
 
 
+# Unsaved components of one customer, to be persisted per model with bulk_create
+CustomerParts = namedtuple("CustomerParts", ("customer", "account", "contract", "extension"))
+
+
+class CustomerManager(models.Manager):
+    """
+    Manager pre-joining the one-to-one extension, account and contract rows,
+    so attribute access on listed customers does not fire one query per row.
+    """
+
+    def get_queryset(self):
+        """
+        Overridden queryset with select_related on the reverse one-to-ones.
+        :return: QuerySet<Customer>
+        """
+        return super().get_queryset().select_related("rc", "bc", "account",
+                                                     "regularcontract",
+                                                     "businesscontract")
+
+
 class Customer(ContactDataMixin):
     """
-    Model for representing customer data in the system, extends from ContactDataMixin
+    Model for representing customer data in the system, extends from ContactDataMixin.
+    The default manager pre-joins the extension, account and contract tables.
     """
 
+    objects = CustomerManager()
+
     # Enum type REGULAR customer
-    REGULAR = "REGULAR"
+    REGULAR = 0
     # Enum type BUSINESS customer
-    BUSINESS = "BUSINESS"
+    BUSINESS = 1
 
     choices = (
         (REGULAR,"Regular"),
         (BUSINESS, "Business")
     )
 
-    # Required field for storing customer enum type
-    type = models.CharField(max_length=10, choices=choices, blank=False)
+    # Required field for storing customer enum type, stored as a small integer
+    # so comparisons and the type index work on native integers
+    type = models.PositiveSmallIntegerField(choices=choices, blank=False)
+
+    # Meta class for specifing properties of class
+    class Meta:
+        # Index for the type filters in get_regular_customers/get_business_customers
+        indexes = [models.Index(fields=["type"])]
 
     @classmethod
-    def get_regular_customers(cls):
+    def get_regular_customers(cls, *fields):
         """
         Class method for returning all regular customers in database.
+        Pass field names to load only those columns with .only(); chain
+        .select_related(None) when the pre-joined extensions are not needed.
+        :param fields: optional field names to fetch
         :return QuerySet<Customer|REGULAR>:
         """
-        return cls.objects.filter(type=Customer.REGULAR).all()
+        queryset = cls.objects.filter(type=Customer.REGULAR)
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset.all()
 
     @classmethod
-    def get_business_customers(cls):
+    def get_business_customers(cls, *fields):
         """
         Class method for returning all business customers in database.
+        Pass field names to load only those columns with .only(); chain
+        .select_related(None) when the pre-joined extensions are not needed.
+        :param fields: optional field names to fetch
         :return QuerySet<Customer|BUSINESS>:
         """
-        return cls.objects.filter(type=Customer.BUSINESS).all()
+        queryset = cls.objects.filter(type=Customer.BUSINESS)
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset.all()
+
+    @classmethod
+    def get_contact_listing(cls):
+        """
+        Class method returning (id, email, phone_number) tuples for listings,
+        skipping model instantiation and the pre-joined extension columns.
+        :return QuerySet<tuple>:
+        """
+        return cls.objects.select_related(None).values_list("id", "email", "phone_number")
 
     @classmethod
     def create(cls, customer_type, contract, account, email, phone_number, **kwargs):
@@ -124,6 +227,76 @@ class Customer(ContactDataMixin):
             customer.businesscontract = contract
         return customer
 
+    @classmethod
+    def build_regular(cls, contract, account, email, phone_number, **kwargs):
+        """
+        Class method building the unsaved components of a regular customer.
+        Unlike create, nothing is hooked to the base instance, so batch
+        callers can persist each component list with bulk_create.
+        :param contract: unsaved RegularContract object
+        :param account: unsaved Account object
+        :param email: str
+        :param phone_number: str
+        :param kwargs: RegularCustomer extension arguments
+        :return: CustomerParts
+        """
+        customer = cls(type=Customer.REGULAR, email=email, phone_number=phone_number)
+        return CustomerParts(customer=customer,
+                             account=account,
+                             contract=contract,
+                             extension=RegularCustomer(**kwargs))
+
+    @classmethod
+    def build_business(cls, contract, account, email, phone_number, **kwargs):
+        """
+        Class method building the unsaved components of a business customer.
+        Unlike create, nothing is hooked to the base instance, so batch
+        callers can persist each component list with bulk_create.
+        :param contract: unsaved BusinessContract object
+        :param account: unsaved Account object
+        :param email: str
+        :param phone_number: str
+        :param kwargs: BusinessCustomer extension arguments
+        :return: CustomerParts
+        """
+        customer = cls(type=Customer.BUSINESS, email=email, phone_number=phone_number)
+        return CustomerParts(customer=customer,
+                             account=account,
+                             contract=contract,
+                             extension=BusinessCustomer(**kwargs))
+
+    @classmethod
+    def bulk_create_customers(cls, parts, batch_size=1000):
+        """
+        Class method persisting CustomerParts built with build_regular or
+        build_business. Components are split into per-model lists and each
+        list is inserted with one bulk_create, in FK dependency order, inside
+        a single transaction.
+        :param parts: list of CustomerParts
+        :param batch_size: int
+        :return: list of Customer objects
+        """
+        customers = [part.customer for part in parts]
+        with transaction.atomic():
+            _bulk_create(cls.objects, customers, batch_size=batch_size)
+            for part in parts:
+                part.account.customer = part.customer
+                part.contract.customer = part.customer
+                part.extension.customer_base = part.customer
+            Account.objects.bulk_create([part.account for part in parts],
+                                        batch_size=batch_size)
+            regular = [part for part in parts if part.customer.type == Customer.REGULAR]
+            business = [part for part in parts if part.customer.type == Customer.BUSINESS]
+            RegularContract.objects.bulk_create([part.contract for part in regular],
+                                                batch_size=batch_size)
+            RegularCustomer.objects.bulk_create([part.extension for part in regular],
+                                                batch_size=batch_size)
+            BusinessContract.objects.bulk_create([part.contract for part in business],
+                                                 batch_size=batch_size)
+            BusinessCustomer.objects.bulk_create([part.extension for part in business],
+                                                 batch_size=batch_size)
+        return customers
+
     @property
     def contract(self):
         """ Contract property :getter"""
@@ -146,52 +319,93 @@ class Customer(ContactDataMixin):
         else:
             raise AttributeError("Type of customer not set yet...")
 
+    @transaction.atomic
     def save(self, *args,**kwargs):
         """
-        Overridden save method for saving object to database.
+        Overridden save method for saving object to database. The whole
+        cascade of component saves commits as a single transaction.
         :param args: positional arguments
         :param kwargs: key dictionary arguments
         :return: None
         """
         super().save(*args, **kwargs)
-        self.account = self.account
+        # Re-point the components at self so their FK columns pick up the
+        # primary key assigned by the insert above.
+        self.account.customer = self
         self.account.save()
-        self.contract = self.contract
-        self.contract.save()
+        contract = self.contract
+        contract.customer = self
+        contract.save()
         if self.type == Customer.REGULAR:
-            self.rc = self.rc
+            self.rc.customer_base = self
             self.rc.save()
         else:
-            self.bc = self.bc
+            self.bc.customer_base = self
             self.bc.save()
 
+    @transaction.atomic
     def delete(self, *args, **kwargs):
         """
-        Overridden method for deleting Customer object from database.
+        Overridden method for deleting Customer object from database. The
+        account, contract and customer extension rows all reference Customer
+        with on_delete=CASCADE, so the base delete removes them in one
+        collector pass; the only extra work is the debt check, done with a
+        single EXISTS query instead of fetching the account row.
         :param args: positional arguments
         :param kwargs: key dictionary arguments
         :return: Customer <deleted>
         """
-        if self.account.balance.amount < Money("0.0").amount:
+        if Account.objects.filter(customer=self, balance__lt=0).exists():
             raise ValueError("Cannot remove user due to debt...")
-        self.account.delete()
-        self.contract.delete()
-        if self.type == Customer.REGULAR:
-            self.rc.delete()
-        else:
-            self.bc.delete()
         return super().delete(*args, **kwargs)
 
-    def __getattr__(self, item):
+    @property
+    def first_name(self):
         """
-        Method for delegating attribute calls to hooked RegularCustomer or BusinessCustomer
-        :param item: attribute object
-        :return: item called from RegularCustomer or BusinessCustomer context
+        First name from the RegularCustomer extension.
+        :return: str|None
         """
-        if self.type == Customer.REGULAR:
-            return getattr(self.rc, item)
-        else:
-            return getattr(self.bc, item)
+        return self.rc.first_name if self.type == Customer.REGULAR else None
+
+    @property
+    def last_name(self):
+        """
+        Last name from the RegularCustomer extension.
+        :return: str|None
+        """
+        return self.rc.last_name if self.type == Customer.REGULAR else None
+
+    @property
+    def apartment_number(self):
+        """
+        Apartment number from the RegularCustomer extension.
+        :return: str|None
+        """
+        return self.rc.apartment_number if self.type == Customer.REGULAR else None
+
+    @property
+    def address(self):
+        """
+        Address from the RegularCustomer extension.
+        :return: Address|None
+        """
+        return self.rc.address if self.type == Customer.REGULAR else None
+
+    @property
+    def company_name(self):
+        """
+        Company name from the BusinessCustomer extension.
+        :return: str|None
+        """
+        return self.bc.company_name if self.type == Customer.BUSINESS else None
+
+    @property
+    def company_id(self):
+        """
+        Company id from the BusinessCustomer extension.
+        :return: str|None
+        """
+        return self.bc.company_id if self.type == Customer.BUSINESS else None
 
     def __str__(self):
         """
@@ -218,10 +432,22 @@ class Account(models.Model):
     def pay(self):
         """
         Withdraw amount from account based on total price of services in contract's addendum.
-        """
-        prices = map(lambda s: s.total_price, self.customer.contract.current_addendum.services.all())
-        amount = reduce(lambda summary, price: summary + price, prices)
-        self.balance -= amount
+        The denormalized per-service totals are summed database-side in a
+        single aggregate query, and the balance is decremented with one
+        atomic F() UPDATE instead of a read-modify-write of the whole row.
+        Services inserted through bulk_create skip the post_save receiver
+        and carry an unfilled cache; that only happens before any includes
+        are added (the m2m receiver refreshes the cache), so their own
+        price is the exact fallback.
+        """
+        services = self.customer.contract.current_addendum.services
+        total = services.aggregate(
+            total=Sum(Coalesce(F("total_price_cached"), F("price"))))["total"]
+        # The aggregate returns a bare decimal; denominate it in the
+        # account's own currency rather than the py-moneyed default
+        amount = Money(total or 0, self.balance.currency)
+        Account.objects.filter(pk=self.pk).update(balance=F("balance") - amount)
+        self.refresh_from_db(fields=["balance", "balance_currency"])
         return amount
 
     def __str__(self):
@@ -260,34 +486,51 @@ class BusinessCustomer(models.Model):
     company_id = models.CharField(max_length=50, blank=False, null=False, unique=True)
 
 
+class ContractManager(models.Manager):
+    """
+    Manager pre-joining the customer base and its extensions so __str__ and
+    report paths do not fire one query per contract.
+    """
+
+    def get_queryset(self):
+        """
+        Overridden queryset with select_related on the customer chain.
+        :return: QuerySet<Contract>
+        """
+        return super().get_queryset().select_related("customer__rc", "customer__bc")
+
+
 class Contract(models.Model):
     """
     Abstract model representing contract data in the system.
+    The default manager pre-joins the customer base and its extensions.
     """
+
+    objects = ContractManager()
     # Active enum type of Contract
-    ACTIVE = "ACTIVE"
+    ACTIVE = 0
     # Suspended enum type of Contract
-    SUSPENDED = "SUSPENDED"
+    SUSPENDED = 1
 
     status_choices = (
         (ACTIVE,"ACTIVE"),
         (SUSPENDED,"SUSPENDED")
     )
     # EXPIRABLE enum type of Contract
-    EXPIRABLE = "EXPIRABLE"
+    EXPIRABLE = 0
     # NONEXPIRABLE enum type of Contract
-    NONEXPIRABLE = "NONEXPIRABLE"
+    NONEXPIRABLE = 1
 
     duration_choices = (
         (EXPIRABLE, "EXPIRABLE"),
         (NONEXPIRABLE, "NONEXPIRABLE")
     )
 
-    # Required field duartion_type for storing type of Contract based on duration
-    duration_type = models.CharField(max_length=12,
-                                     choices=duration_choices,
-                                     blank=False,
-                                     default=EXPIRABLE)
+    # Required field duartion_type for storing type of Contract based on duration,
+    # stored as a small integer
+    duration_type = models.PositiveSmallIntegerField(choices=duration_choices,
+                                                     blank=False,
+                                                     default=EXPIRABLE)
 
     # Reference to Customer model
     customer = models.OneToOneField("webcom.Customer", on_delete=models.CASCADE)
@@ -295,8 +538,8 @@ class Contract(models.Model):
     approval_date = models.DateTimeField(null=False)
     # Optional field termination_date
     termination_date = models.DateTimeField(null=True, blank=True)
-    # Field for storing status state of Contract
-    status = models.CharField(max_length=10, choices=status_choices, default=ACTIVE)
+    # Field for storing status state of Contract, stored as a small integer
+    status = models.PositiveSmallIntegerField(choices=status_choices, default=ACTIVE)
 
     # Meta class for specifing properties of class
     class Meta:
@@ -308,10 +551,21 @@ class Contract(models.Model):
         Property :getter: for contract's duration.
         :return datetime.datetime:
         """
+        return self.duration_at()
+
+    def duration_at(self, now=None):
+        """
+        Duration of the contract as of a given moment. Report paths that
+        iterate many contracts should draw timezone.now() once and pass it
+        in, instead of resolving the active timezone per row.
+        :param now: optional datetime used for non-terminated contracts
+        :return datetime.datetime:
+        """
         if self.termination_date is not None:
             return self.termination_date - self.approval_date
-        else:
-            return timezone.now() + timedelta(days=100)
+        if now is None:
+            now = timezone.now()
+        return now + _DEFAULT_DURATION
 
     def save(self, *args, **kwargs):
         """
@@ -322,13 +576,15 @@ class Contract(models.Model):
         """
         super().save(*args, **kwargs)
 
-    @property
+    @cached_property
     def current_addendum(self):
         """
-        Property :getter: returning current addendum of contract
+        Property :getter: returning current addendum of contract, cached on
+        the instance after first access; callers mutating addendums should
+        invalidate with del instance.current_addendum.
         :return:
         """
-        return self.addendums.latest(field_name="datetime_created")
+        return self.addendums.latest()
 
     def __str__(self):
         """
@@ -355,6 +611,11 @@ class RegularContract(Contract):
     # Required field of payment term :type: int
     pay_term = models.PositiveSmallIntegerField(default=30, blank=False)
 
+    # Meta class for specifing properties of class
+    class Meta:
+        # Index for filtering contracts on status state
+        indexes = [models.Index(fields=["status"])]
+
     def __str__(self):
         """
         To string method
@@ -378,6 +639,11 @@ class BusinessContract(Contract):
     # Required field of payment term :type: int
     pay_term = models.PositiveSmallIntegerField(default=60, blank=False)
 
+    # Meta class for specifing properties of class
+    class Meta:
+        # Index for filtering contracts on status state
+        indexes = [models.Index(fields=["status"])]
+
     def __str__(self):
         return "Contract:{} {} -> {}".format(self.approval_date,
                                              self.status,
@@ -394,16 +660,32 @@ class Service(models.Model):
     price = MoneyField(max_digits=10, decimal_places=2, blank=False, null=False)
     # Set of included Services
     included = models.ManyToManyField("webcom.Service", symmetrical=False, blank=True)
+    # Denormalized total price, kept in sync by the receivers below so reads
+    # are a single column fetch instead of an aggregate per access
+    total_price_cached = MoneyField(max_digits=10, decimal_places=2, null=True, blank=True)
 
     @property
     def total_price(self):
         """
         Total price of service based on services' price and total prce of included services.
+        Reads the denormalized column maintained by the receivers below and
+        only computes the aggregate when the column has not been filled yet.
         :return: Money
         """
-        if self.included.count() > 0:
-            prices = map(lambda service: service.total_price, self.included.all())
-            return reduce(lambda summary, price: summary + price, prices) + self.price
+        if self.total_price_cached is not None:
+            return self.total_price_cached
+        return self.compute_total_price()
+
+    def compute_total_price(self):
+        """
+        Compute total price with one aggregate query. Included services cannot
+        include anything themselves (enforced by clean), so one SUM over the
+        includes covers the whole graph.
+        :return: Money
+        """
+        included = self.included.aggregate(total=Sum("price"))["total"]
+        if included:
+            return self.price + Money(included, self.price.currency)
         return self.price
 
     def clean(self):
@@ -413,13 +695,17 @@ class Service(models.Model):
         """
         if not self.id:
             return
-        if self in self.included.all():
+        # All three facts come from a single aggregate over the includes;
+        # distinct counts guard against fan-out from the included join
+        agg = self.included.aggregate(
+            cnt=Count("id", distinct=True),
+            self_in=Count("id", distinct=True, filter=Q(pk=self.pk)),
+            deep=Count("id", distinct=True, filter=Q(included__isnull=False)))
+        if agg["self_in"]:
             raise ValueError("{} cannot include itself...".format(str(self)))
-        if self.included.count() > 3:
+        if agg["cnt"] > 3:
             raise ValueError("{} cannot include more than 3 service...".format(str(self)))
-        if self.included.annotate(included_count=Count('included'))\
-                .filter(included_count__gt=0)\
-                .exists():
+        if agg["deep"]:
             raise ValueError("{} cannot include services that has another includes...".format(str(self)))
 
     def __str__(self):
@@ -430,10 +716,66 @@ class Service(models.Model):
         return "Service: {} {}".format(self.name, self.price)
 
 
+class AddendumManager(models.Manager):
+    """
+    Manager pre-joining the contract bases and prefetching the service graph,
+    collapsing the services traversal to a constant number of queries.
+    """
+
+    def get_queryset(self):
+        """
+        Overridden queryset with contract join and service prefetch.
+        :return: QuerySet<Addendum>
+        """
+        return super().get_queryset().select_related("regular_contract", "business_contract")\
+            .prefetch_related("services__included")
+
+
+def _refresh_total_price(service):
+    """
+    Recompute and store the denormalized total price of a service when it
+    differs from the stored value.
+    :param service: Service object
+    :return: None
+    """
+    total = service.compute_total_price()
+    if total != service.total_price_cached:
+        Service.objects.filter(pk=service.pk).update(total_price_cached=total)
+        service.total_price_cached = total
+
+
+@receiver(post_save, sender=Service)
+def _service_saved(sender, instance, **kwargs):
+    """
+    Receiver refreshing the stored total price of a saved service and of the
+    services including it.
+    """
+    _refresh_total_price(instance)
+    for parent in instance.service_set.all():
+        _refresh_total_price(parent)
+
+
+@receiver(m2m_changed, sender=Service.included.through)
+def _service_includes_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Receiver refreshing stored total prices when the include graph changes.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        for parent in Service.objects.filter(pk__in=pk_set or ()):
+            _refresh_total_price(parent)
+    else:
+        _refresh_total_price(instance)
+
+
 class Addendum(models.Model):
     """
     Model representing addendum data of contract in the system.
+    The default manager pre-joins the contracts and prefetches the services.
     """
+
+    objects = AddendumManager()
     # Required creation datetime field.
     datetime_created = models.DateTimeField()
     # Set of included services
@@ -449,6 +791,15 @@ class Addendum(models.Model):
                                           on_delete=models.CASCADE,
                                           blank=True, null=True)
 
+    # Meta class for specifing properties of class
+    class Meta:
+        # Default ordering field for latest()/earliest() calls
+        get_latest_by = "datetime_created"
+        # Composite indexes turning the latest() lookup in current_addendum
+        # into an index seek per contract
+        indexes = [models.Index(fields=["regular_contract", "-datetime_created"]),
+                   models.Index(fields=["business_contract", "-datetime_created"])]
+
     def clean(self):
         """
         Validation method of model, raises ValueError if data is not valid.
@@ -463,7 +814,8 @@ class Addendum(models.Model):
         Property getter for contract base
         :return: RegularContract|BusinessContract
         """
-        if hasattr(self, "regular_contract"):
+        # The nullable FK column answers which base is set without a query
+        if self.regular_contract_id is not None:
             return self.regular_contract
         return self.business_contract
 
@@ -489,6 +841,42 @@ class Addendum(models.Model):
         return "Addendum: {} -> {}".format(self.datetime_created, str(self.contract))
 
 
+class CustomerBillingSummary(models.Model):
+    """
+    Read-only model over the customer_billing_summary database view, giving
+    report pages one row per customer with the current addendum's total and
+    the account balance instead of a query chain per customer. The view is
+    created by a RunSQL migration; the model is unmanaged.
+    """
+    # Customer the summary row belongs to, also the primary key of the view
+    customer = models.OneToOneField("webcom.Customer", primary_key=True,
+                                    db_column="customer_id",
+                                    on_delete=models.DO_NOTHING,
+                                    related_name="billing_summary")
+    # Customer enum type copied from the base row
+    type = models.PositiveSmallIntegerField()
+    # Contact email copied from the base row
+    email = models.EmailField(max_length=30)
+    # Account balance of the customer
+    balance = MoneyField(max_digits=10, decimal_places=2, null=True)
+    # Summed cached totals of the services on the current addendum
+    total_price = models.DecimalField(max_digits=10, decimal_places=2, null=True)
+
+    # Meta class for specifing properties of class
+    class Meta:
+        managed = False
+        db_table = "customer_billing_summary"
+
+    def __str__(self):
+        """
+        To string method
+        :return: str
+        """
+        return "Billing summary of {} -> {} / {}".format(self.customer_id,
+                                                         self.total_price,
+                                                         self.balance)
+
+
 class Employee(Person, ContactDataMixin):
     """
     Abstract class representing Employee type instance in the system,
@@ -515,16 +903,17 @@ class TechnicalEmployee(Employee):
     Class for representing technical employee in the system, extends Employee class.
     """
     # TECHNICIAN enum type of technical employee
-    TECHNICIAN = "Technician"
+    TECHNICIAN = 0
     # SYSADMIN enum type of technical employee
-    SYSADMIN = "SysAdmin"
+    SYSADMIN = 1
     choices = (
         (TECHNICIAN,"Technician"),
         (SYSADMIN, "System administrator")
     )
 
-    # Required field for storing enum type of technical employee
-    employee_type = models.CharField(max_length=10, choices=choices, blank=False)
+    # Required field for storing enum type of technical employee, stored as a
+    # small integer
+    employee_type = models.PositiveSmallIntegerField(choices=choices, blank=False)
 
     @classmethod
     def create(cls, type, email, phone_number, **kwargs):
@@ -575,37 +964,34 @@ class TechnicalEmployee(Employee):
     @property
     def bonus(self):
         """
-        Overridden method for calculating salary bonus of technical employee,
-        delegation to extension,
+        Overridden method for calculating salary bonus of technical employee.
+        Computed from the employee_type discriminator directly, without
+        fetching the extension row.
         """
-        if self.employee_type == TechnicalEmployee.TECHNICIAN:
-            return getattr(self.technician, "bonus")
-        else:
-            return getattr(self.sysadmin, "bonus")
+        if self.employee_type == TechnicalEmployee.SYSADMIN:
+            return self.salary*_BONUS_RATE
+        return _ZERO
 
+    @transaction.atomic
     def save(self, *args, **kwargs):
         """
-        Overridden save method
+        Overridden save method, committing base and extension as a single
+        transaction.
         :param args: positional argumetns
         :param kwargs: key value arguments
         :return: None
         """
         super().save(*args, **kwargs)
+        # Re-point the extension at self so its FK column picks up the
+        # primary key assigned by the insert above.
         if self.employee_type == TechnicalEmployee.TECHNICIAN:
-            self.technician = self.technician
+            self.technician.technicalemployee_base = self
             self.technician.save()
         else:
-            self.sysadmin = self.sysadmin
+            self.sysadmin.technicalemployee_base = self
             self.sysadmin.save()
 
-    def __getattr__(self, item):
-        """
-        Method for delegating attribute calls to Technician or SysAdmin extension
-        :param item: attribute object
-        :return: item called from Technician or SysAdmin extension
-        """
-        return getattr(self.instance, item)
-
+    @transaction.atomic
     def delete(self, *args, **kwargs):
         """
         Overridden method for deleting TechnicalEmloyee object from database.
@@ -633,7 +1019,7 @@ class Technician(models.Model):
         Method for calculating salary bonus of technician.
         :return: Money
         """
-        return Money("0.0")
+        return _ZERO
 
 
 class SysAdmin(models.Model):
@@ -652,7 +1038,7 @@ class SysAdmin(models.Model):
         Method for calculating salary bonus of sysadmin.
         :return: Money
         """
-        return self.technicalemployee_base.salary*0.1
+        return self.technicalemployee_base.salary*_BONUS_RATE
 
 
 class RegularEmployee(Employee):
@@ -676,7 +1062,7 @@ class ClientManager(RegularEmployee):
         Method for calculating salary bonus of client manager.
         :return: Money
         """
-        return Money("0.0")
+        return _ZERO
 
 
 class Accountant(RegularEmployee):
@@ -686,7 +1072,7 @@ class Accountant(RegularEmployee):
         Method for calculating salary bonus of accountant.
         :return: Money
         """
-        return Money("0.0")
+        return _ZERO
 
 
 class Device(models.Model):
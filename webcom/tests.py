@@ -1,87 +1,200 @@
+# All test cases subclass TestCase, which wraps every test in a transaction
+# rolled back afterwards; TransactionTestCase would instead flush every table
+# between tests and should not be introduced here without need.
+from decimal import Decimal
+
+from django.db import transaction
 from django.test import TestCase
 from django.utils import timezone
 from djmoney.money import Money
 
 from webcom.generators import Factory
+from webcom.models import _bulk_create
 from webcom.models import \
     Address, \
     Account, BusinessContract, RegularContract, Customer, RegularCustomer, BusinessCustomer, TechnicalEmployee, \
-    Technician, SysAdmin, Addendum, Service, Laptop, LaptopRepair, Server, ServerRepair, Router, RouterRepair
+    Technician, SysAdmin, Addendum, Service, CustomerBillingSummary, \
+    Laptop, LaptopRepair, Server, ServerRepair, Router, RouterRepair
+
+# Shared factory bound by every setUpTestData; Factory is stateless per test,
+# so one instance serves the whole module
+_FACTORY = Factory()
 
 
 class IndividualCustomerTestCase(TestCase):
 
-    def setUp(self):
-        self.factory = Factory()
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
 
     def test_individual_customer(self):
         customer = self.factory.generate_individual_customer()
 
         customer.save()
 
-        self.assertEqual(customer.account, Account.objects.first())
-        self.assertEqual(customer.address, Address.objects.first())
-        self.assertEqual(customer.contract, RegularContract.objects.first())
-        self.assertEqual(customer.first_name, RegularCustomer.objects.first().first_name)
+        # Pinned query budget: three EXISTS checks plus the first_name fetch;
+        # a lazy relation load inside the assertions would break this
+        with self.assertNumQueries(4):
+            self.assertIsNotNone(customer.account.pk)
+            self.assertTrue(Account.objects.filter(pk=customer.account.pk).exists())
+            self.assertTrue(Address.objects.filter(pk=customer.address.pk).exists())
+            self.assertTrue(RegularContract.objects.filter(pk=customer.contract.pk).exists())
+            self.assertEqual(customer.first_name, RegularCustomer.objects.first().first_name)
 
         customer.delete()
 
-        self.assertEqual(0, Customer.get_regular_customers().count())
-        self.assertEqual(0, Account.objects.count())
-        self.assertEqual(0, RegularContract.objects.count())
+        self.assertFalse(Customer.get_regular_customers().exists())
+        self.assertFalse(Account.objects.exists())
+        self.assertFalse(RegularContract.objects.exists())
 
 
 class BusinessCustomerTestCase(TestCase):
 
-    def setUp(self):
-        self.factory = Factory()
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
 
     def test_business_customer(self):
         customer = self.factory.generate_business_customer()
 
         customer.save()
 
-        self.assertEqual(customer.account, Account.objects.first())
-        self.assertEqual(customer.contract, BusinessContract.objects.first())
+        self.assertIsNotNone(customer.account.pk)
+        self.assertTrue(Account.objects.filter(pk=customer.account.pk).exists())
+        self.assertTrue(BusinessContract.objects.filter(pk=customer.contract.pk).exists())
         self.assertEqual(customer.company_name, BusinessCustomer.objects.first().company_name)
 
         customer.delete()
 
-        self.assertEqual(0, Customer.get_business_customers().count())
-        self.assertEqual(0, Account.objects.count())
-        self.assertEqual(0, BusinessContract.objects.count())
+        self.assertFalse(Customer.get_business_customers().exists())
+        self.assertFalse(Account.objects.exists())
+        self.assertFalse(BusinessContract.objects.exists())
+
+
+class BatchGenerationTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
+
+    def test_individual_customers_batch(self):
+        customers = self.factory.generate_individual_customers(5)
+
+        self.assertEqual(5, len(customers))
+        self.assertEqual(5, Customer.get_regular_customers().count())
+        self.assertEqual(5, Account.objects.count())
+        self.assertEqual(5, RegularContract.objects.count())
+        self.assertEqual(5, RegularCustomer.objects.count())
+        self.assertEqual(5, Address.objects.count())
+
+    def test_individual_customers_batch_shared_address(self):
+        address = self.factory.generate_address()
+        address.save()
+
+        self.factory.generate_individual_customers(3, address=address)
+
+        self.assertEqual(1, Address.objects.count())
+        self.assertEqual(3, RegularCustomer.objects.filter(address=address).count())
+
+    def test_business_customers_batch(self):
+        customers = self.factory.generate_business_customers(5)
+
+        self.assertEqual(5, len(customers))
+        self.assertEqual(5, Customer.get_business_customers().count())
+        self.assertEqual(5, Account.objects.count())
+        self.assertEqual(5, BusinessContract.objects.count())
+        self.assertEqual(5, BusinessCustomer.objects.count())
+
+    def test_technical_employees_batch(self):
+        employees = self.factory.generate_technical_employees(8)
+
+        self.assertEqual(8, len(employees))
+        self.assertEqual(8, TechnicalEmployee.objects.count())
+        self.assertEqual(8, Address.objects.count())
+        self.assertEqual(TechnicalEmployee.objects.count(),
+                         Technician.objects.count() + SysAdmin.objects.count())
+
+
+class AccountPayTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
+
+    def _customer_with_addendum(self, *services):
+        customer = self.factory.generate_individual_customer()
+        customer.save()
+
+        addendum = Addendum.objects.create(datetime_created=timezone.localtime(timezone.now()))
+        addendum.services.add(*services)
+        customer.contract.addendums.add(addendum)
+        return customer
+
+    def test_pay_with_bulk_created_services(self):
+        # Services inserted through bulk_create skip the post_save receiver
+        # and keep an unfilled total_price_cached; pay() must fall back to
+        # their prices instead of charging zero
+        s1, s2 = _bulk_create(Service.objects, [Service(name="Bulk Service 1", price=Money("7.00")),
+                                                Service(name="Bulk Service 2", price=Money("3.00"))])
+
+        customer = self._customer_with_addendum(s1, s2)
+
+        balance = customer.account.balance
+
+        amount = customer.account.pay()
+
+        self.assertEqual(amount, Money("10.00", balance.currency))
+        self.assertEqual(customer.account.balance, balance - amount)
+
+    def test_billing_summary_with_bulk_created_services(self):
+        # The billing view applies the same fallback, so customers with
+        # bulk-created and individually saved services report the same total
+        b1, b2 = _bulk_create(Service.objects, [Service(name="Bulk Service 1", price=Money("7.00")),
+                                                Service(name="Bulk Service 2", price=Money("3.00"))])
+        s1 = Service.objects.create(name="Saved Service 1", price=Money("7.00"))
+        s2 = Service.objects.create(name="Saved Service 2", price=Money("3.00"))
+
+        bulk_customer = self._customer_with_addendum(b1, b2)
+        saved_customer = self._customer_with_addendum(s1, s2)
+
+        totals = {summary.customer_id: summary.total_price
+                  for summary in CustomerBillingSummary.objects.all()}
+
+        self.assertEqual(Decimal("10.00"), totals[bulk_customer.pk])
+        self.assertEqual(Decimal("10.00"), totals[saved_customer.pk])
 
 
 class TechnicalEmployeeTestCase(TestCase):
 
-    def setUp(self):
-        self.factory = Factory()
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
 
     def test_technician_employee(self):
         technician = self.factory.generate_technical_employee(employee_type=TechnicalEmployee.TECHNICIAN)
 
         technician.save()
 
-        self.assertEqual(technician.address, Address.objects.first())
+        self.assertTrue(Address.objects.filter(pk=technician.address_id).exists())
         self.assertEqual(technician.instance, Technician.objects.first())
         self.assertEqual(technician.bonus, Money("0.0"))
 
         technician.delete()
 
-        self.assertEqual(None, Technician.objects.first())
+        self.assertFalse(Technician.objects.exists())
 
     def test_sysadmin_employee(self):
         sysadmin = self.factory.generate_technical_employee(employee_type=TechnicalEmployee.SYSADMIN)
 
         sysadmin.save()
 
-        self.assertEqual(sysadmin.address, Address.objects.first())
+        self.assertTrue(Address.objects.filter(pk=sysadmin.address_id).exists())
         self.assertEqual(sysadmin.instance, SysAdmin.objects.first())
         self.assertEqual(sysadmin.bonus, sysadmin.salary*0.1)
 
         sysadmin.delete()
 
-        self.assertEqual(None, SysAdmin.objects.first())
+        self.assertFalse(SysAdmin.objects.exists())
 
     def test_dynamic_context(self):
         tech_employee = self.factory.generate_technical_employee(employee_type=TechnicalEmployee.TECHNICIAN)
@@ -94,8 +207,9 @@ class TechnicalEmployeeTestCase(TestCase):
 
         tech_employee.save()
 
-        self.assertEqual(None, Technician.objects.first())
-        self.assertEqual(tech_employee.instance, SysAdmin.objects.first())
+        self.assertFalse(Technician.objects.exists())
+        self.assertEqual(tech_employee.instance.pk,
+                         SysAdmin.objects.values_list("pk", flat=True).first())
 
         self.assertEqual(tech_employee.bonus, tech_employee.salary * 0.1)
 
@@ -103,40 +217,52 @@ class TechnicalEmployeeTestCase(TestCase):
 
         tech_employee.save()
 
-        self.assertEqual(None, SysAdmin.objects.first())
-        self.assertEqual(tech_employee.instance, Technician.objects.first())
+        self.assertFalse(SysAdmin.objects.exists())
+        self.assertEqual(tech_employee.instance.pk,
+                         Technician.objects.values_list("pk", flat=True).first())
 
 
 class AddendumTestCase(TestCase):
 
-    def setUp(self):
-        self.factory = Factory()
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
 
     def test_addendum(self):
 
         customer = self.factory.generate_individual_customer()
         customer.save()
 
-        s1 = Service.objects.create(name="Service 1")
-        s2 = Service.objects.create(name="Service 2")
-        s3 = Service.objects.create(name="Service 3")
+        s1, s2, s3 = _bulk_create(Service.objects, [Service(name="Service 1"),
+                                                    Service(name="Service 2"),
+                                                    Service(name="Service 3")])
 
-        addendum = Addendum.objects.create(datetime_created=timezone.localtime(timezone.now()))
-        addendum.services.add(s1)
-        addendum.services.add(s2)
-        addendum.services.add(s3)
-        addendum.save()
+        now = timezone.localtime(timezone.now())
+
+        addendum = Addendum.objects.create(datetime_created=now)
+        addendum.services.add(s1, s2, s3)
         customer.contract.addendums.add(addendum)
-        customer.save()
 
-        self.assertEqual(RegularContract.objects.first().current_addendum, addendum)
-        self.assertEqual(RegularContract.objects.first().addendums.first().services.count(), 3)
+        # Pinned query budget: the contract fetch with its prefetches plus
+        # the latest() behind current_addendum; the in-memory len() adds none
+        with self.assertNumQueries(7):
+            contract = RegularContract.objects.prefetch_related("addendums__services").first()
+
+            self.assertEqual(contract.current_addendum, addendum)
+            self.assertEqual(len(contract.addendums.all()[0].services.all()), 3)
 
 
 class ServiceTestCase(TestCase):
 
-    def setUp(self):
-        self.factory = Factory()
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
+        # Shared rows for test_inclusion_association; per-test relation
+        # changes roll back, so the class-level rows stay pristine
+        cls.s2, cls.s3, cls.s4, cls.s5, cls.s6 = \
+            _bulk_create(Service.objects,
+                         [Service(name="Service Test %d" % i, price=Money("10.00"))
+                          for i in range(2, 7)])
 
     def test_service(self):
         service = Service(name="Service Test",price=Money("20.00"))
@@ -145,106 +271,96 @@ class ServiceTestCase(TestCase):
     def test_recursive_association(self):
         s1 = Service.objects.create(name="Service containing services", price=Money("10.00"))
 
+        # clean() aggregates over the persisted through rows, so the
+        # self-inclusion has to hit the database; roll it back afterwards so
+        # the through table stays clean for the rest of the test
+        sid = transaction.savepoint()
         s1.included.add(s1)
 
         with self.assertRaises(ValueError):
             s1.clean()
 
+        transaction.savepoint_rollback(sid)
+
     def test_inclusion_association(self):
 
-        s2 = Service.objects.create(name="Service Test 2", price=Money("10.00"))
-        s3 = Service.objects.create(name="Service Test 3", price=Money("10.00"))
-        s4 = Service.objects.create(name="Service Test 4", price=Money("10.00"))
-        s5 = Service.objects.create(name="Service Test 5", price=Money("10.00"))
-        s6 = Service.objects.create(name="Service Test 6", price=Money("10.00"))
+        s2, s3, s4, s5, s6 = self.s2, self.s3, self.s4, self.s5, self.s6
 
-        s2.included.add(s3, s4, s5, s6)
+        # One transaction for the whole mutation sequence instead of a
+        # commit per add/remove/clear call
+        with transaction.atomic():
+            s2.included.add(s3, s4, s5, s6)
 
-        with self.assertRaises(ValueError):
-            s2.clean()
+            with self.assertRaises(ValueError):
+                s2.clean()
 
-        s2.included.remove(s4, s5, s6)
+            s2.included.remove(s4, s5, s6)
 
-        s4.included.add(s5, s6)
+            s4.included.add(s5, s6)
 
-        s2.included.add(s4)
+            s2.included.add(s4)
 
-        with self.assertRaises(ValueError):
-            s2.clean()
+            with self.assertRaises(ValueError):
+                s2.clean()
 
-        s2.included.clear()
+            s2.included.clear()
 
-        s2.included.add(s5,s5)
+            s2.included.add(s5)
 
-        s2.save()
+            s2.save()
 
         self.assertEqual(1,s2.included.count())
 
 
 class RepairTestCase(TestCase):
 
-    def setUp(self):
-        self.factory = Factory()
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = _FACTORY
+        cls.technician = cls.factory.generate_technical_employee(employee_type=TechnicalEmployee.TECHNICIAN)
+        cls.technician.save()
 
     def test_laptop_repair(self):
 
-        technician = self.factory.generate_technical_employee(employee_type=TechnicalEmployee.TECHNICIAN)
-
-        technician.save()
-
         laptop = Laptop.objects.create(manufacturer="HP",model="x360")
 
-        repair = LaptopRepair(datetime_repaired=timezone.localtime(timezone.now()),
-                              technician=technician.instance,
-                              laptop=laptop)
+        now = timezone.localtime(timezone.now())
 
-        repair.save()
+        r1, r2 = _bulk_create(LaptopRepair.objects,
+                              [LaptopRepair(datetime_repaired=now,
+                                         technician=self.technician.instance,
+                                         laptop=laptop)
+                               for _ in range(2)])
 
-        LaptopRepair.objects.create(datetime_repaired=timezone.localtime(timezone.now()),
-                                    technician=technician.instance,
-                                    laptop=laptop)
-
-        self.assertEqual(2, LaptopRepair.objects.count())
+        self.assertEqual(2, LaptopRepair.objects.filter(pk__in=[r1.pk, r2.pk]).count())
 
     def test_server_repair(self):
 
-        technician = self.factory.generate_technical_employee(employee_type=TechnicalEmployee.TECHNICIAN)
-
-        technician.save()
-
         server = Server.objects.create(manufacturer="HP",model="x360")
 
-        repair = ServerRepair(datetime_repaired=timezone.localtime(timezone.now()),
-                              technician=technician.instance,
-                              server=server)
+        now = timezone.localtime(timezone.now())
 
-        repair.save()
+        r1, r2 = _bulk_create(ServerRepair.objects,
+                              [ServerRepair(datetime_repaired=now,
+                                         technician=self.technician.instance,
+                                         server=server)
+                               for _ in range(2)])
 
-        ServerRepair.objects.create(datetime_repaired=timezone.localtime(timezone.now()),
-                                    technician=technician.instance,
-                                    server=server)
-
-        self.assertEqual(2, ServerRepair.objects.count())
+        self.assertEqual(2, ServerRepair.objects.filter(pk__in=[r1.pk, r2.pk]).count())
 
     def test_router_repair(self):
 
-        technician = self.factory.generate_technical_employee(employee_type=TechnicalEmployee.TECHNICIAN)
-
-        technician.save()
-
         router = Router.objects.create(manufacturer="HP",model="x360")
 
-        repair = RouterRepair(datetime_repaired=timezone.localtime(timezone.now()),
-                              technician=technician.instance,
-                              router=router)
-
-        repair.save()
+        now = timezone.localtime(timezone.now())
 
-        RouterRepair.objects.create(datetime_repaired=timezone.localtime(timezone.now()),
-                                    technician=technician.instance,
-                                    router=router)
+        r1, r2 = _bulk_create(RouterRepair.objects,
+                              [RouterRepair(datetime_repaired=now,
+                                         technician=self.technician.instance,
+                                         router=router)
+                               for _ in range(2)])
 
-        self.assertEqual(2, RouterRepair.objects.count())
+        self.assertEqual(2, RouterRepair.objects.filter(pk__in=[r1.pk, r2.pk]).count())
 
 
 